@@ -8,7 +8,9 @@ following the principles of Test-Driven Development (TDD).
 import unittest
 from unittest.mock import patch
 import io
-from tic_tac_toe_game import Board, GameLogic, RandomBot, GameRunner
+import random
+from tic_tac_toe_game import (Board, GameLogic, RandomBot, GameRunner,
+                              batch_run_games, play_one_game, outcome_probabilities)
 
 
 class TestBoard(unittest.TestCase):
@@ -21,6 +23,13 @@ class TestBoard(unittest.TestCase):
             for col in range(3):
                 self.assertIsNone(board.get_cell(row, col))
 
+    def test_get_cell_out_of_range(self):
+        """Test that reading a cell off the board raises IndexError."""
+        board = Board()
+        for row, col in [(3, 0), (0, 3), (-1, 0), (0, -1)]:
+            with self.assertRaises(IndexError):
+                board.get_cell(row, col)
+
     def test_place_marker(self):
         """Test placing a marker on the board."""
         board = Board()
@@ -34,6 +43,21 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(ValueError):
             board.place_marker(0, 0, 'O')
 
+    def test_place_marker_out_of_range(self):
+        """Test that placing a marker off the board raises IndexError."""
+        board = Board()
+        for row, col in [(3, 0), (0, 3), (-1, 0), (0, -1)]:
+            with self.assertRaises(IndexError):
+                board.place_marker(row, col, 'X')
+        self.assertEqual(board.available_moves(), Board().available_moves())
+
+    def test_place_unknown_marker(self):
+        """Test that placing a marker other than 'X' or 'O' raises ValueError."""
+        board = Board()
+        with self.assertRaises(ValueError):
+            board.place_marker(0, 0, 'x')
+        self.assertIsNone(board.get_cell(0, 0))
+
     def test_is_full_with_empty_board(self):
         """Test that an empty board is not full."""
         board = Board()
@@ -59,6 +83,53 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(len(moves), 8)
         self.assertNotIn((0, 0), moves)
 
+    def test_bitboards_track_markers(self):
+        """Test that each marker sets its own bit at index row * 3 + col."""
+        board = Board()
+        board.place_marker(0, 0, 'X')
+        board.place_marker(2, 1, 'O')
+        self.assertEqual(board.x_bb, 0b000000001)
+        self.assertEqual(board.o_bb, 0b010000000)
+
+    def test_place_marker_idx(self):
+        """Test placing a marker by player index."""
+        board = Board()
+        board.place_marker_idx(0, 1, 0)
+        board.place_marker_idx(2, 2, 1)
+        self.assertEqual(board.get_cell(0, 1), 'X')
+        self.assertEqual(board.get_cell(2, 2), 'O')
+        self.assertEqual(board.boards, [0b000000010, 0b100000000])
+
+    def test_empty_indices(self):
+        """Test getting the bit indices of empty cells."""
+        board = Board()
+        self.assertEqual(board.empty_indices(), list(range(9)))
+        for row, col in [(0, 0), (0, 1), (1, 2), (2, 0), (2, 2)]:
+            board.place_marker(row, col, 'O')
+        self.assertEqual(board.empty_indices(), [2, 3, 4, 7])
+
+    def test_empty_mask(self):
+        """Test that placing a marker clears its bit in the empty mask."""
+        board = Board()
+        self.assertEqual(board.empty_mask, 0x1FF)
+        board.place_marker(1, 2, 'O')
+        self.assertEqual(board.empty_mask, 0x1FF & ~(1 << 5))
+
+    def test_random_empty(self):
+        """Test that random_empty only picks empty cells."""
+        board = Board()
+        for row, col in [(0, 0), (0, 1), (1, 1), (2, 0), (2, 2)]:
+            board.place_marker(row, col, 'X')
+        for _ in range(20):
+            self.assertIn(board.random_empty(random), board.available_moves())
+
+    def test_board_has_no_instance_dict(self):
+        """Test that Board uses __slots__ instead of a per-instance dict."""
+        board = Board()
+        self.assertFalse(hasattr(board, '__dict__'))
+        with self.assertRaises(AttributeError):
+            board.extra = 1
+
     def test_string_representation(self):
         """Test the string representation of the board."""
         board = Board()
@@ -133,7 +204,32 @@ class TestGameLogic(unittest.TestCase):
         game_logic = GameLogic(board)
         self.assertFalse(game_logic.check_win('X'))
         self.assertFalse(game_logic.check_win('O'))
-        self.assertTrue(game_logic.check_draw())
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(game_logic.check_draw())
+
+    def test_is_terminal_after_move(self):
+        """Test the (win, draw) flags reported after a move."""
+        board = Board()
+        game_logic = GameLogic(board)
+        board.place_marker(0, 0, 'X')
+        self.assertEqual(game_logic.is_terminal_after_move('X'), (False, False))
+        board.place_marker(0, 1, 'X')
+        board.place_marker(0, 2, 'X')
+        self.assertEqual(game_logic.is_terminal_after_move('X'), (True, False))
+
+    def test_is_terminal_after_move_win_on_full_board(self):
+        """Test that a win on the last cell is not also reported as a draw."""
+        board = Board()
+        markers = [
+            ['X', 'O', 'X'],
+            ['O', 'X', 'O'],
+            ['O', 'X', 'X']
+        ]
+        for row in range(3):
+            for col in range(3):
+                board.place_marker(row, col, markers[row][col])
+        game_logic = GameLogic(board)
+        self.assertEqual(game_logic.is_terminal_after_move('X'), (True, False))
 
 
 class TestRandomBot(unittest.TestCase):
@@ -144,13 +240,25 @@ class TestRandomBot(unittest.TestCase):
         board = Board()
         bot = RandomBot('X')
 
-        # Mock random.choice to return a specific move
-        with patch('random.choice', return_value=(0, 0)):
+        # Mock the bot's rng to pick the first empty cell
+        with patch.object(bot.rng, 'randrange', return_value=0):
             row, col = bot.make_move(board)
             self.assertEqual(row, 0)
             self.assertEqual(col, 0)
             self.assertEqual(board.get_cell(0, 0), 'X')
 
+    def test_make_move_picks_kth_empty_cell(self):
+        """Test that the k-th empty cell is chosen, skipping occupied ones."""
+        board = Board()
+        board.place_marker(0, 0, 'O')
+        board.place_marker(0, 2, 'O')
+        bot = RandomBot('X', random.Random())
+
+        # Empty cells in order: (0, 1), (1, 0), (1, 1), ...
+        with patch.object(bot.rng, 'randrange', return_value=2) as mock_randrange:
+            self.assertEqual(bot.make_move(board), (1, 1))
+        mock_randrange.assert_called_once_with(7)
+
     def test_make_move_on_full_board(self):
         """Test that the bot raises ValueError on a full board."""
         board = Board()
@@ -307,6 +415,146 @@ class TestGameRunner(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("GAME DRAW!", output)
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_turns_alternate_starting_with_x(self, mock_stdout):
+        """Test that the bots alternate turns, X moving first."""
+        board = Board()
+        game_runner = GameRunner(board, RandomBot('X'), RandomBot('O'))
+        game_runner.run_game()
+
+        players = [line for line in mock_stdout.getvalue().splitlines()
+                   if line.startswith("Player ")]
+        expected = ["Player X:", "Player O:"] * 5
+        self.assertEqual(players, expected[:len(players)])
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_run_game_reports_winner(self, mock_stdout):
+        """Test the end-of-game message when both bots take the first empty cell."""
+        board = Board()
+        bot_x = RandomBot('X')
+        bot_o = RandomBot('O')
+        game_runner = GameRunner(board, bot_x, bot_o)
+        # X takes 0, 2, 4, 6 and completes the anti-diagonal
+        with patch.object(bot_x.rng, 'randrange', return_value=0), \
+                patch.object(bot_o.rng, 'randrange', return_value=0):
+            game_runner.run_game()
+
+        output = mock_stdout.getvalue()
+        self.assertTrue(output.endswith("\nPLAYER X WON!\n"))
+        self.assertNotIn("GAME DRAW!", output)
+
+    def test_run_game_writes_output_once(self):
+        """Test that the whole game is written to stdout in a single call."""
+        board = Board()
+        game_runner = GameRunner(board, RandomBot('X'), RandomBot('O'))
+        with patch('sys.stdout') as mock_stdout:
+            game_runner.run_game()
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        self.assertTrue(output.startswith("Starting Tic-Tac-Toe Bot vs Bot game:\n"))
+        self.assertIn(str(board), output)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_run_game_flushes_output_on_error(self, mock_stdout):
+        """Test that buffered output is written when a bot raises unexpectedly."""
+        board = Board()
+        bot_x = RandomBot('X')
+        game_runner = GameRunner(board, bot_x, RandomBot('O'))
+        with patch.object(bot_x.rng, 'randrange', side_effect=TypeError("boom")):
+            with self.assertRaises(TypeError):
+                game_runner.run_game()
+
+        output = mock_stdout.getvalue()
+        self.assertIn("Initial board:", output)
+        self.assertIn("Player X:", output)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('time.sleep')
+    def test_run_game_without_delay(self, mock_sleep, mock_stdout):
+        """Test that a full game runs to completion without sleeping by default."""
+        board = Board()
+        game_runner = GameRunner(board, RandomBot('X'), RandomBot('O'))
+        game_runner.run_game()
+
+        mock_sleep.assert_not_called()
+        output = mock_stdout.getvalue()
+        self.assertTrue("WON!" in output or "GAME DRAW!" in output)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('time.sleep')
+    def test_run_game_with_delay(self, mock_sleep, mock_stdout):
+        """Test that the configured delay is applied before each turn."""
+        board = Board()
+        game_runner = GameRunner(board, RandomBot('X'), RandomBot('O'), turn_delay=0.5)
+        game_runner.run_game()
+
+        self.assertGreaterEqual(mock_sleep.call_count, 5)
+        mock_sleep.assert_called_with(0.5)
+
+
+class TestPlayOneGame(unittest.TestCase):
+    """Tests for the play_one_game function."""
+
+    def test_returns_outcome_code(self):
+        """Test that the outcome is one of X win, O win or draw."""
+        for seed in range(50):
+            self.assertIn(play_one_game(random.Random(seed)), (0, 1, 2))
+
+    def test_forced_x_win(self):
+        """Test a game where X completes the top row."""
+        rng = random.Random()
+        # X: 0, O: 3, X: 1, O: 4, X: 2
+        with patch.object(rng, 'choice', side_effect=[0, 3, 1, 4, 2]):
+            self.assertEqual(play_one_game(rng), 0)
+
+
+class TestBatchRunGames(unittest.TestCase):
+    """Tests for the batch_run_games function."""
+
+    def test_outcomes_sum_to_game_count(self):
+        """Test that every game is counted exactly once."""
+        x_wins, o_wins, draws = batch_run_games(200)
+        self.assertEqual(x_wins + o_wins + draws, 200)
+
+    def test_seeded_rng_is_reproducible(self):
+        """Test that the same seed produces the same tallies."""
+        first = batch_run_games(100, random.Random(42))
+        second = batch_run_games(100, random.Random(42))
+        self.assertEqual(first, second)
+
+    def test_first_player_advantage(self):
+        """Test that X, moving first, wins more often than O."""
+        x_wins, o_wins, draws = batch_run_games(2000, random.Random(0))
+        self.assertGreater(x_wins, o_wins)
+
+
+class TestOutcomeProbabilities(unittest.TestCase):
+    """Tests for the outcome_probabilities function."""
+
+    def test_empty_board(self):
+        """Test the known outcome distribution of random play."""
+        x_win, o_win, draw = outcome_probabilities()
+        self.assertAlmostEqual(x_win + o_win + draw, 1.0)
+        self.assertAlmostEqual(x_win, 0.58492, places=5)
+        self.assertAlmostEqual(o_win, 0.28810, places=5)
+        self.assertAlmostEqual(draw, 0.12698, places=5)
+
+    def test_terminal_position(self):
+        """Test that a won position is certain."""
+        # X holds the top row, O holds two cells of the middle row
+        self.assertEqual(outcome_probabilities(0b000000111, 0b000011000, 1),
+                         (1.0, 0.0, 0.0))
+
+    def test_matches_batch_run_games(self):
+        """Test that sampled tallies agree with the exact distribution."""
+        n = 5000
+        x_wins, o_wins, draws = batch_run_games(n, random.Random(1))
+        x_win, o_win, draw = outcome_probabilities()
+        self.assertAlmostEqual(x_wins / n, x_win, delta=0.03)
+        self.assertAlmostEqual(o_wins / n, o_win, delta=0.03)
+        self.assertAlmostEqual(draws / n, draw, delta=0.03)
+
 
 if __name__ == '__main__':
     unittest.main()
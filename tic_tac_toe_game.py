@@ -5,8 +5,78 @@ This module implements a Tic-Tac-Toe game where two random bots play against eac
 The implementation follows Test-Driven Development (TDD) principles.
 """
 
+import io
 import random
+import sys
 import time
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+
+# Bitmask with one bit set for each of the 9 cells
+FULL_MASK = 0x1FF
+
+# Bitmasks for the 8 winning lines: 3 rows, 3 columns, 2 diagonals
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# (row, col) tuple for each bit index, shared to avoid reallocating them
+_COORDS = tuple((i // 3, i % 3) for i in range(9))
+
+# Marker for each player index: 0 is X, 1 is O
+_M = "XO"
+
+# Player index for each marker
+_MARKER_INDEX = {'X': 0, 'O': 1}
+
+# Format string used to render the board, one field per cell
+_TEMPLATE = "{}|{}|{}\n-+-+-\n{}|{}|{}\n-+-+-\n{}|{}|{}"
+
+# Turn headers indexed by player, and the possible game-over messages
+_TURN_MSG = ("\nPlayer X:\n", "\nPlayer O:\n")
+_MSG = {
+    'X': "\nPLAYER X WON!\n",
+    'O': "\nPLAYER O WON!\n",
+    'draw': "\nGAME DRAW!\n",
+}
+
+
+def _set_bits(mask: int) -> List[int]:
+    """Get the indices of the set bits in `mask`, lowest first."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def _cell_index(row: int, col: int) -> int:
+    """
+    Get the bit index of a cell.
+
+    Raises:
+        IndexError: If the row or column is outside the 3x3 grid
+    """
+    if not (0 <= row < 3 and 0 <= col < 3):
+        raise IndexError(f"Cell ({row}, {col}) is off the board")
+    return row * 3 + col
+
+
+def _marker_index(marker: str) -> int:
+    """
+    Get the player index (0 for X, 1 for O) of a marker.
+
+    Raises:
+        ValueError: If the marker is not 'X' or 'O'
+    """
+    try:
+        return _MARKER_INDEX[marker]
+    except KeyError:
+        raise ValueError(f"Unknown marker {marker!r}") from None
 
 
 class Board:
@@ -14,62 +84,103 @@ class Board:
     Represents the Tic-Tac-Toe game board.
     
     The board is a 3x3 grid where each cell can be empty (None)
-    or contain a marker ('X' or 'O').
+    or contain a marker ('X' or 'O'). Internally the state is kept as
+    two bitboards indexed by player (0 for X, 1 for O), with bit
+    ``row * 3 + col`` set for each occupied cell.
     """
 
-    def __init__(self):
+    __slots__ = ('boards', 'empty_mask')
+
+    def __init__(self) -> None:
         """Initialize an empty 3x3 board."""
-        self.board = [[None for _ in range(3)] for _ in range(3)]
+        self.boards: List[int] = [0, 0]
+        self.empty_mask: int = FULL_MASK
+
+    @property
+    def x_bb(self) -> int:
+        """Bitboard of the cells holding 'X'."""
+        return self.boards[0]
+
+    @property
+    def o_bb(self) -> int:
+        """Bitboard of the cells holding 'O'."""
+        return self.boards[1]
 
-    def get_cell(self, row, col):
-        """Get the value of a cell on the board."""
-        return self.board[row][col]
+    def get_cell(self, row: int, col: int) -> Optional[str]:
+        """
+        Get the value of a cell on the board.
+
+        Raises:
+            IndexError: If the row or column is outside the board
+        """
+        index = _cell_index(row, col)
+        if self.empty_mask >> index & 1:
+            return None
+        return _M[self.boards[1] >> index & 1]
 
-    def place_marker(self, row, col, marker):
+    def place_marker(self, row: int, col: int, marker: str) -> None:
         """
         Place a marker on the board.
         
         Raises:
+            IndexError: If the row or column is outside the board
+            ValueError: If the cell is already occupied or the marker
+                is not 'X' or 'O'
+        """
+        self.place_marker_idx(row, col, _marker_index(marker))
+
+    def place_marker_idx(self, row: int, col: int, idx: int) -> None:
+        """
+        Place the marker of player `idx` (0 for X, 1 for O) on the board.
+
+        Raises:
+            IndexError: If the row or column is outside the board
             ValueError: If the cell is already occupied
         """
-        if self.board[row][col] is not None:
+        bit = 1 << _cell_index(row, col)
+        if not self.empty_mask & bit:
             raise ValueError(f"Cell ({row}, {col}) already occupied")
-        self.board[row][col] = marker
+        self.boards[idx] |= bit
+        self.empty_mask &= ~bit
 
-    def is_full(self):
+    def is_full(self) -> bool:
         """Check if the board is full."""
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] is None:
-                    return False
-        return True
+        return not self.empty_mask
 
-    def available_moves(self):
+    def available_moves(self) -> List[Tuple[int, int]]:
         """Get all available (empty) cells on the board."""
-        moves = []
-        for row in range(3):
-            for col in range(3):
-                if self.board[row][col] is None:
-                    moves.append((row, col))
-        return moves
-
-    def __str__(self):
+        return [_COORDS[i] for i in _set_bits(self.empty_mask)]
+
+    def empty_indices(self) -> List[int]:
+        """Get the bit indices (row * 3 + col) of all empty cells."""
+        return _set_bits(self.empty_mask)
+
+    def random_empty(self, rng) -> Tuple[int, int]:
+        """
+        Pick a random empty cell on the board.
+
+        Args:
+            rng: Source of randomness providing `randrange`, such as the
+                `random` module or a `random.Random` instance
+
+        Returns:
+            The (row, col) of the chosen cell
+        """
+        empty = self.empty_mask
+        # Pick k uniformly, then clear the k lowest set bits
+        for _ in range(rng.randrange(bin(empty).count('1'))):
+            empty &= empty - 1
+        return _COORDS[(empty & -empty).bit_length() - 1]
+
+    def _cell_str(self, index: int) -> str:
+        """Get the display character for the cell at a bit index."""
+        if self.empty_mask >> index & 1:
+            return ' '
+        return _M[self.boards[1] >> index & 1]
+
+    def __str__(self) -> str:
         """Get a string representation of the board."""
-        result = []
-        for row in range(3):
-            row_str = ""
-            for col in range(3):
-                cell = self.board[row][col]
-                if cell is None:
-                    row_str += " "
-                else:
-                    row_str += cell
-                if col < 2:
-                    row_str += "|"
-            result.append(row_str)
-            if row < 2:
-                result.append("-+-+-")
-        return "\n".join(result)
+        return _TEMPLATE.format(*(self._cell_str(i) for i in range(9)))
 
 
 class GameLogic:
@@ -77,58 +188,89 @@ class GameLogic:
     Handles game rules and determines win/draw conditions.
     """
 
-    def __init__(self, board):
+    __slots__ = ('board',)
+
+    def __init__(self, board: Board) -> None:
         """Initialize GameLogic with a board."""
         self.board = board
 
-    def check_win(self, marker):
+    def check_win(self, marker: str) -> bool:
         """Check if the specified marker has won."""
-        # Check rows
-        for row in range(3):
-            if all(self.board.get_cell(row, col) == marker for col in range(3)):
+        idx = _MARKER_INDEX.get(marker)
+        if idx is None:
+            return False
+        bb = self.board.boards[idx]
+        for mask in WIN_MASKS:
+            if bb & mask == mask:
                 return True
+        return False
 
-        # Check columns
-        for col in range(3):
-            if all(self.board.get_cell(row, col) == marker for row in range(3)):
-                return True
+    def check_draw(self) -> bool:
+        """
+        Check if the game is a draw.
 
-        # Check diagonals
-        if all(self.board.get_cell(i, i) == marker for i in range(3)):
-            return True
+        Deprecated: use `is_terminal_after_move`, which avoids checking
+        both players for a win.
+        """
+        warnings.warn(
+            "check_draw() is deprecated, use is_terminal_after_move()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.board.is_full() and not self.check_win('X') and not self.check_win('O')
 
-        if all(self.board.get_cell(i, 2 - i) == marker for i in range(3)):
-            return True
+    def is_terminal_after_move(self, marker: str) -> Tuple[bool, bool]:
+        """
+        Check whether the move just made by `marker` ended the game.
 
-        return False
+        Only the player who just moved can have completed a line, so the
+        opponent is not checked.
 
-    def check_draw(self):
-        """Check if the game is a draw."""
-        return self.board.is_full() and not self.check_win('X') and not self.check_win('O')
+        Returns:
+            A tuple of (win, draw)
+        """
+        win = self.check_win(marker)
+        draw = not win and self.board.is_full()
+        return win, draw
 
 
 class RandomBot:
     """A bot that makes random moves."""
 
-    def __init__(self, marker):
-        """Initialize a bot with a marker."""
+    __slots__ = ('marker', 'idx', 'rng')
+
+    def __init__(self, marker: str, rng: Optional[random.Random] = None) -> None:
+        """
+        Initialize a bot with a marker.
+
+        Args:
+            marker: The marker this bot places ('X' or 'O')
+            rng: Optional `random.Random` instance; a fresh one is
+                created if not given
+        """
         self.marker = marker
+        self.idx = _marker_index(marker)
+        self.rng = rng if rng is not None else random.Random()
 
-    def make_move(self, board):
+    def make_move(self, board: Board) -> Tuple[int, int]:
         """Make a random move on the board."""
-        available_moves = board.available_moves()
-        if not available_moves:
+        if not board.empty_mask:
             raise ValueError("No available moves")
 
-        row, col = random.choice(available_moves)
-        board.place_marker(row, col, self.marker)
+        row, col = board.random_empty(self.rng)
+        board.place_marker_idx(row, col, self.idx)
         return row, col
 
 
 class GameRunner:
     """Manages the flow of a Tic-Tac-Toe game."""
 
-    def __init__(self, board, bot_x, bot_o):
+    __slots__ = ('board', 'bot_x', 'bot_o', 'game_logic', 'players', 'markers',
+                 'turn', 'turn_delay', '_buf', '_log')
+
+    def __init__(
+        self, board: Board, bot_x: RandomBot, bot_o: RandomBot, turn_delay: float = 0.0
+    ) -> None:
         """
         Initialize GameRunner with a board and two bots.
         
@@ -136,53 +278,178 @@ class GameRunner:
             board: The game board
             bot_x: The bot playing as X
             bot_o: The bot playing as O
+            turn_delay: Seconds to pause before each turn (0 for no pause)
         """
         self.board = board
         self.bot_x = bot_x
         self.bot_o = bot_o
         self.game_logic = GameLogic(board)
-        self.current_player = 'X'
+        self.players = (bot_x, bot_o)
+        self.markers = _M
+        self.turn = 0
+        self.turn_delay = turn_delay
+        self._buf = io.StringIO()
+        self._log = self._buf.write
+
+    def _flush(self) -> None:
+        """Write buffered output to stdout and clear the buffer."""
+        sys.stdout.write(self._buf.getvalue())
+        self._buf.seek(0)
+        self._buf.truncate()
+
+    def run_game(self) -> None:
+        """
+        Run the game until completion.
 
-    def run_game(self):
-        """Run the game until completion."""
-        print("Starting Tic-Tac-Toe Bot vs Bot game:")
-        print("\nInitial board:")
-        print(self.board)
+        Output is buffered and written once at the end of the game, or
+        after every turn when a turn delay is set so it can be watched.
+        Buffered output is still written if the game is interrupted.
+        """
+        log = self._log
+        log("Starting Tic-Tac-Toe Bot vs Bot game:\n")
+        log("\nInitial board:\n")
+        log(str(self.board))
+        log("\n")
+
+        try:
+            while True:
+                # Optional delay for better visualization
+                if self.turn_delay:
+                    self._flush()
+                    time.sleep(self.turn_delay)
+
+                marker = self.markers[self.turn]
+                log(_TURN_MSG[self.turn])
+
+                # Make move
+                try:
+                    self.players[self.turn].make_move(self.board)
+                except ValueError as e:
+                    log(f"Error: {e}\n")
+                    break
+
+                # Display board after move
+                log(str(self.board))
+                log("\n")
+
+                # Check for win or draw
+                win, draw = self.game_logic.is_terminal_after_move(marker)
+                if win:
+                    log(_MSG[marker])
+                    break
+                if draw:
+                    log(_MSG['draw'])
+                    break
+
+                # Switch player
+                self.turn ^= 1
+        finally:
+            self._flush()
+
+
+def play_one_game(rng=random) -> int:
+    """
+    Play one silent random bot vs random bot game on a pair of bitboards.
 
-        while True:
-            # Add fixed delay of 1 second for better visualization
-            time.sleep(1)
+    Uses only integer state and bit operations, so it avoids the
+    Board/GameRunner objects and all output.
 
-            print(f"\nPlayer {self.current_player}:")
+    Args:
+        rng: Source of randomness providing `choice`
 
-            # Make move
-            try:
-                if self.current_player == 'X':
-                    self.bot_x.make_move(self.board)
-                else:
-                    self.bot_o.make_move(self.board)
-            except ValueError as e:
-                print(f"Error: {e}")
-                break
+    Returns:
+        0 if X won, 1 if O won, 2 if the game was a draw
+    """
+    bbs = [0, 0]
+    empty = FULL_MASK
+    player = 0
+    while True:
+        bit = 1 << rng.choice(_set_bits(empty))
+        bb = bbs[player] | bit
+        bbs[player] = bb
+        empty &= ~bit
+        for mask in WIN_MASKS:
+            if bb & mask == mask:
+                return player
+        if not empty:
+            return 2
+        player ^= 1
+
+
+def batch_run_games(n: int, rng=random) -> Tuple[int, int, int]:
+    """
+    Play `n` silent random bot vs random bot games and tally the outcomes.
+
+    Args:
+        n: Number of games to play
+        rng: Source of randomness providing `choice`
 
-            # Display board after move
-            print(self.board)
+    Returns:
+        A tuple of (x_wins, o_wins, draws)
+    """
+    counts = [0, 0, 0]
+    for _ in range(n):
+        counts[play_one_game(rng)] += 1
+    return counts[0], counts[1], counts[2]
+
+
+# Transposition table for outcome_probabilities, keyed by (x_bb, o_bb, turn)
+_TT: Dict[Tuple[int, int, int], Tuple[float, float, float]] = {}
 
-            # Check for win
-            if self.game_logic.check_win(self.current_player):
-                print(f"\nPLAYER {self.current_player} WON!")
-                break
 
-            # Check for draw
-            if self.game_logic.check_draw():
-                print("\nGAME DRAW!")
-                break
+def outcome_probabilities(
+    x_bb: int = 0, o_bb: int = 0, turn: int = 0
+) -> Tuple[float, float, float]:
+    """
+    Get the exact outcome distribution of random play from a position.
+
+    Each position is solved once and cached in a transposition table, so
+    positions reached through different move orders share their result
+    and repeated queries are O(1).
+
+    Args:
+        x_bb: Bitboard of cells held by X
+        o_bb: Bitboard of cells held by O
+        turn: 0 if X is to move, 1 if O is to move
+
+    Returns:
+        A tuple of (x_win, o_win, draw) probabilities
+    """
+    key = (x_bb, o_bb, turn)
+    cached = _TT.get(key)
+    if cached is not None:
+        return cached
+
+    for mask in WIN_MASKS:
+        if x_bb & mask == mask:
+            result = (1.0, 0.0, 0.0)
+            break
+        if o_bb & mask == mask:
+            result = (0.0, 1.0, 0.0)
+            break
+    else:
+        empty = ~(x_bb | o_bb) & FULL_MASK
+        if not empty:
+            result = (0.0, 0.0, 1.0)
+        else:
+            x_win = o_win = draw = 0.0
+            moves = [1 << i for i in _set_bits(empty)]
+            for bit in moves:
+                if turn == 0:
+                    px, po, pd = outcome_probabilities(x_bb | bit, o_bb, 1)
+                else:
+                    px, po, pd = outcome_probabilities(x_bb, o_bb | bit, 0)
+                x_win += px
+                o_win += po
+                draw += pd
+            n = len(moves)
+            result = (x_win / n, o_win / n, draw / n)
 
-            # Switch player
-            self.current_player = 'O' if self.current_player == 'X' else 'X'
+    _TT[key] = result
+    return result
 
 
-def main():
+def main() -> None:
     """Main function to run the Tic-Tac-Toe game."""
     print("Tic-Tac-Toe: Random Bot vs Random Bot")
 
@@ -192,7 +459,7 @@ def main():
 
     # Run the game
     board = Board()
-    game_runner = GameRunner(board, bot_x, bot_o)
+    game_runner = GameRunner(board, bot_x, bot_o, turn_delay=1)
     game_runner.run_game()
 
 